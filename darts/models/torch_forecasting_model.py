@@ -107,7 +107,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                  work_dir: str = os.getcwd(),
                  log_tensorboard: bool = False,
                  nr_epochs_val_period: int = 10,
-                 torch_device_str: Optional[str] = None):
+                 torch_device_str: Optional[str] = None,
+                 save_checkpoints: bool = True):
 
         """ Pytorch-based Forecasting Model.
 
@@ -152,6 +153,10 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         torch_device_str
             Optionally, a string indicating the torch device to use. (default: "cuda:0" if a GPU
             is available, otherwise "cpu")
+        save_checkpoints
+            Whether or not to save the model after every epoch (as well as the best model, according to the
+            validation loss), in `[work_dir]/.darts/checkpoints/`. These checkpoints are needed by
+            `load_from_checkpoint()`. Disabling them saves the cost of serializing the model at every epoch.
         """
         super().__init__()
 
@@ -169,6 +174,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         self.output_chunk_length = output_chunk_length
         self.log_tensorboard = log_tensorboard
         self.nr_epochs_val_period = nr_epochs_val_period
+        self.save_checkpoints = save_checkpoints
 
         self.model_name = model_name
         self.work_dir = work_dir
@@ -325,11 +331,14 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                              self.input_dim, self.output_dim, input_dim, output_dim
                          ))
 
+        # pinned memory only helps (asynchronous) host to GPU copies
+        pin_memory = self.device.type == 'cuda'
+
         train_loader = DataLoader(torch_train_dataset,
                                   batch_size=self.batch_size,
                                   shuffle=True,
                                   num_workers=0,
-                                  pin_memory=True,
+                                  pin_memory=pin_memory,
                                   drop_last=True)
 
         # Prepare validation data
@@ -337,7 +346,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                                                                  batch_size=self.batch_size,
                                                                  shuffle=False,
                                                                  num_workers=0,
-                                                                 pin_memory=True,
+                                                                 pin_memory=pin_memory,
                                                                  drop_last=False)
 
         # Prepare tensorboard writer
@@ -436,10 +445,12 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                 in_tsr = torch.cat([in_tsr, in_cov_tsr], dim=1)
             in_tsr = in_tsr.view(1, self.input_chunk_length, -1)
 
-            out_sequence = self._produce_prediction(in_tsr, n)
+            # no need to track gradients at inference time
+            with torch.no_grad():
+                out_sequence = self._produce_prediction(in_tsr, n)
 
             # translate to numpy
-            out_sequence = out_sequence.cpu().detach().numpy()
+            out_sequence = out_sequence.cpu().numpy()
             ts_forecasts.append(self._build_forecast_series(out_sequence.reshape(n, -1),
                                                             input_series=target_series))
         return ts_forecasts
@@ -497,7 +508,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
 
             for batch_idx, (data, target) in enumerate(train_loader):
                 self.model.train()
-                data, target = data.to(self.device), target.to(self.device)
+                data = data.to(self.device, non_blocking=True)
+                target = target.to(self.device, non_blocking=True)
                 output = self.model(data)
                 loss = self.criterion(output, target)
                 self.optimizer.zero_grad()
@@ -514,7 +526,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                 tb_writer.add_scalar("training/loss_total", total_loss / (batch_idx + 1), epoch)
                 tb_writer.add_scalar("training/learning_rate", self._get_learning_rate(), epoch)
 
-            self._save_model(False, _get_checkpoint_folder(self.work_dir, self.model_name), epoch)
+            if self.save_checkpoints:
+                self._save_model(False, _get_checkpoint_folder(self.work_dir, self.model_name), epoch)
 
             if epoch % self.nr_epochs_val_period == 0:
                 training_loss = total_loss / len(train_loader)
@@ -525,7 +538,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
 
                     if validation_loss < best_loss:
                         best_loss = validation_loss
-                        self._save_model(True, _get_checkpoint_folder(self.work_dir, self.model_name), epoch)
+                        if self.save_checkpoints:
+                            self._save_model(True, _get_checkpoint_folder(self.work_dir, self.model_name), epoch)
 
                     if verbose:
                         print("Training loss: {:.4f}, validation loss: {:.4f}, best val loss: {:.4f}".
@@ -538,7 +552,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         self.model.eval()
         with torch.no_grad():
             for batch_idx, (data, target) in enumerate(val_loader):
-                data, target = data.to(self.device), target.to(self.device)
+                data = data.to(self.device, non_blocking=True)
+                target = target.to(self.device, non_blocking=True)
                 output = self.model(data)
                 loss = self.criterion(output, target)
                 total_loss += loss.item()
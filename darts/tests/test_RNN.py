@@ -64,6 +64,15 @@ if TORCH_AVAILABLE:
             pred4 = model3.predict(n=6)
             self.assertEqual(len(pred4), 6)
 
+        def test_fit_without_checkpoints(self):
+            model = RNNModel(input_chunk_length=1, output_chunk_length=1, n_epochs=2,
+                             model_name='unittest-model-no-checkpoints', save_checkpoints=False)
+            model.fit(self.series[:60], val_series=self.series[60:])
+            with self.assertRaises(FileNotFoundError):
+                model.load_from_checkpoint(model_name='unittest-model-no-checkpoints', best=False)
+            with self.assertRaises(FileNotFoundError):
+                model.load_from_checkpoint(model_name='unittest-model-no-checkpoints', best=True)
+
         def helper_test_pred_length(self, pytorch_model, series):
             model = pytorch_model(input_chunk_length=1, output_chunk_length=3, n_epochs=1)
             model.fit(series)
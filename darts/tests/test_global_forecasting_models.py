@@ -1,5 +1,6 @@
 import logging
 import shutil
+from functools import lru_cache
 
 import pandas as pd
 import numpy as np
@@ -25,18 +26,23 @@ except ImportError:
 if TORCH_AVAILABLE:
     IN_LEN = 24
     OUT_LEN = 12
+    # the fitted models are kept in memory, so there is no need to checkpoint them
     models_cls_kwargs_errs = [
-        (RNNModel, {'model': 'RNN', 'hidden_size': 10, 'n_rnn_layers': 1, 'batch_size': 32, 'n_epochs': 10}, 180.),
-        (TCNModel, {'n_epochs': 10, 'batch_size': 32}, 180.),
-        (TransformerModel, {'d_model': 16, 'nhead': 2, 'num_encoder_layers': 2, 'num_decoder_layers': 2,
-                            'dim_feedforward': 16, 'batch_size': 32, 'n_epochs': 10}, 180.),
-        (NBEATSModel, {'num_stacks': 4, 'num_blocks': 1, 'num_layers': 2, 'layer_widths': 12, 'n_epochs': 10}, 180.)
+        (RNNModel, {'model': 'RNN', 'hidden_size': 10, 'n_rnn_layers': 1, 'batch_size': 32, 'n_epochs': 10,
+                    'save_checkpoints': False}, 180.),
+        (TCNModel, {'n_epochs': 10, 'batch_size': 32, 'save_checkpoints': False}, 180.),
+        (TransformerModel, {'d_model': 8, 'nhead': 2, 'num_encoder_layers': 1, 'num_decoder_layers': 1,
+                            'dim_feedforward': 8, 'batch_size': 32, 'n_epochs': 10, 'save_checkpoints': False}, 180.),
+        (NBEATSModel, {'num_stacks': 1, 'num_blocks': 1, 'num_layers': 1, 'layer_widths': 8, 'n_epochs': 10,
+                       'save_checkpoints': False}, 180.)
     ]
 
-    class GlobalForecastingModelsTestCase(DartsBaseTestClass):
-        # forecasting horizon used in runnability tests
-        forecasting_horizon = 12
-
+    @lru_cache(maxsize=1)
+    def _load_air_passengers():
+        """
+        Returns the scaled AirPassengers series, a noisy copy of its first part and scaled time covariates.
+        Cached, so that the preprocessing only runs once per process.
+        """
         np.random.seed(42)
         torch.manual_seed(42)
 
@@ -45,24 +51,60 @@ if TORCH_AVAILABLE:
         ts_passengers = TimeSeries.from_dataframe(df, 'Month', ['#Passengers'])
         scaler = Scaler()
         ts_passengers = scaler.fit_transform(ts_passengers)
-        ts_pass_train, ts_pass_val = ts_passengers[:-36], ts_passengers[-36:]
+        ts_pass_train = ts_passengers[:-36]
 
         # an additional noisy series
         ts_pass_train_1 = ts_pass_train + 0.01 * tg.gaussian_timeseries(length=len(ts_pass_train),
                                                                         freq=ts_pass_train.freq_str(),
-                                                                        start_ts=ts_pass_train.start_time())
+                                                                        start_ts=ts_pass_train.start_time(),
+                                                                        random_state=42)
 
         # an additional time series serving as covariates
         year_series = tg.datetime_attribute_timeseries(ts_passengers, attribute='year')
         month_series = tg.datetime_attribute_timeseries(ts_passengers, attribute='month')
         scaler_dt = Scaler()
         time_covariates = scaler_dt.fit_transform(year_series.stack(month_series))
-        time_covariates_train, time_covariates_val = time_covariates[:-36], time_covariates[-36:]
+
+        return ts_passengers, ts_pass_train_1, time_covariates
+
+    class GlobalForecastingModelsTestCase(DartsBaseTestClass):
+        # forecasting horizon used in runnability tests
+        forecasting_horizon = 12
+
+        @classmethod
+        def setUpClass(cls):
+            super().setUpClass()
+            cls.ts_passengers, cls.ts_pass_train_1, cls.time_covariates = _load_air_passengers()
+            cls.ts_pass_train, cls.ts_pass_val = cls.ts_passengers[:-36], cls.ts_passengers[-36:]
+            cls.time_covariates_train, cls.time_covariates_val = cls.time_covariates[:-36], cls.time_covariates[-36:]
+
+            # fitted models, keyed by (model class name, model kwargs, fit kind);
+            # each distinct fit only runs once for this test case and is shared by all the tests needing it
+            cls._fitted = {}
+
+        @classmethod
+        def _fitted_model(cls, model_cls, kwargs, fit_kind):
+            key = (model_cls.__name__, str(sorted(kwargs.items())), fit_kind)
+            if key not in cls._fitted:
+                # the models draw their random state from numpy's global one; seed it so that
+                # each fit is reproducible, whichever tests ran (and fitted models) before
+                np.random.seed(42)
+                model = model_cls(input_chunk_length=IN_LEN, output_chunk_length=OUT_LEN, **kwargs)
+                if fit_kind == 'single':
+                    model.fit(cls.ts_pass_train)
+                elif fit_kind == 'multi':
+                    model.fit([cls.ts_pass_train, cls.ts_pass_train_1])
+                elif fit_kind == 'cov':
+                    model.fit(series=[cls.ts_pass_train, cls.ts_pass_train_1],
+                              covariates=[cls.time_covariates_train, cls.time_covariates_train])
+                else:
+                    raise ValueError('Unknown fit kind: {}'.format(fit_kind))
+                cls._fitted[key] = model
+            return cls._fitted[key]
 
         def test_single_ts(self):
             for model_cls, kwargs, err in models_cls_kwargs_errs:
-                model = model_cls(input_chunk_length=IN_LEN, output_chunk_length=OUT_LEN, **kwargs)
-                model.fit(self.ts_pass_train)
+                model = self._fitted_model(model_cls, kwargs, 'single')
                 pred = model.predict(n=36)
                 mape_err = mape(self.ts_pass_val, pred)
                 self.assertTrue(mape_err < err, 'Model {} produces errors too high (one time '
@@ -70,11 +112,7 @@ if TORCH_AVAILABLE:
 
         def test_multi_ts(self):
             for model_cls, kwargs, err in models_cls_kwargs_errs:
-                model = model_cls(input_chunk_length=IN_LEN, output_chunk_length=OUT_LEN, **kwargs)
-                model.fit([self.ts_pass_train, self.ts_pass_train_1])
-                with self.assertRaises(ValueError):
-                    # when model is fit from >1 series, one must provide a series in argument
-                    model.predict(n=1)
+                model = self._fitted_model(model_cls, kwargs, 'multi')
                 pred = model.predict(n=36, series=self.ts_pass_train)
                 mape_err = mape(self.ts_pass_val, pred)
                 self.assertTrue(mape_err < err, 'Model {} produces errors too high (several time '
@@ -94,9 +132,25 @@ if TORCH_AVAILABLE:
                     # N-BEATS does not support multivariate
                     continue
 
-                model = model_cls(input_chunk_length=IN_LEN, output_chunk_length=OUT_LEN, **kwargs)
-                model.fit(series=[self.ts_pass_train, self.ts_pass_train_1],
-                          covariates=[self.time_covariates_train, self.time_covariates_train])
+                model = self._fitted_model(model_cls, kwargs, 'cov')
+                pred = model.predict(n=12, series=self.ts_pass_train, covariates=self.time_covariates_train)
+                mape_err = mape(self.ts_pass_val, pred)
+                self.assertTrue(mape_err < err, 'Model {} produces errors too high (several time '
+                                                'series with covariates). Error = {}'.format(model_cls, mape_err))
+
+        def test_predict_validation_errors(self):
+            # reuses the models fitted for the other tests, so that these checks do not need any extra training
+            for model_cls, kwargs, _ in models_cls_kwargs_errs:
+                model = self._fitted_model(model_cls, kwargs, 'multi')
+                with self.assertRaises(ValueError):
+                    # when model is fit from >1 series, one must provide a series in argument
+                    model.predict(n=1)
+
+                if model_cls == NBEATSModel:
+                    # N-BEATS does not support multivariate
+                    continue
+
+                model = self._fitted_model(model_cls, kwargs, 'cov')
                 with self.assertRaises(ValueError):
                     # when model is fit from >1 series, one must provide a series in argument
                     model.predict(n=1)
@@ -107,9 +161,4 @@ if TORCH_AVAILABLE:
 
                 with self.assertRaises(ValueError):
                     # when model is fit using covariates, n cannot be greater than output_chunk_length
-                    model.predict(n=13, series=self.ts_pass_train)
-
-                pred = model.predict(n=12, series=self.ts_pass_train, covariates=self.time_covariates_train)
-                mape_err = mape(self.ts_pass_val, pred)
-                self.assertTrue(mape_err < err, 'Model {} produces errors too high (several time '
-                                                'series with covariates). Error = {}'.format(model_cls, mape_err))
+                    model.predict(n=13, series=self.ts_pass_train, covariates=self.time_covariates_train)
@@ -68,6 +68,12 @@ class TimeSeriesGenerationTestCase(DartsBaseTestClass):
         for length in [1, 2, 5, 10, 100]:
             test_routine(length)
 
+        # testing that a given random state yields reproducible values
+        self.assertEqual(gaussian_timeseries(length=10, random_state=42),
+                         gaussian_timeseries(length=10, random_state=42))
+        self.assertNotEqual(gaussian_timeseries(length=10, random_state=42),
+                            gaussian_timeseries(length=10, random_state=43))
+
     def test_random_walk_timeseries(self):
 
         # testing for correct length
@@ -4,11 +4,13 @@ Utils for time series generation
 """
 
 import math
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
 import holidays
+from numpy.random import RandomState
+from sklearn.utils import check_random_state
 
 from ..timeseries import TimeSeries
 from ..logging import raise_if_not, get_logger
@@ -130,7 +132,8 @@ def gaussian_timeseries(length: int = 10,
                         freq: str = 'D',
                         mean: Union[float, np.ndarray] = 0.,
                         std: Union[float, np.ndarray] = 1.,
-                        start_ts: pd.Timestamp = pd.Timestamp('2000-01-01')) -> TimeSeries:
+                        start_ts: pd.Timestamp = pd.Timestamp('2000-01-01'),
+                        random_state: Optional[Union[int, RandomState]] = None) -> TimeSeries:
     """
     Creates a gaussian univariate TimeSeries by sampling all the series values independently,
     from a gaussian distribution with mean `mean` and standard deviation `std`.
@@ -153,6 +156,9 @@ def gaussian_timeseries(length: int = 10,
         be used as covariance matrix for a multivariate gaussian distribution.
     start_ts
         The time index of the first entry in the returned TimeSeries.
+    random_state
+        Optionally, a seed or a `numpy.random.RandomState` used to sample the values, so that they do not depend on
+        (nor alter) the global numpy random state. By default, the global numpy random state is used.
 
     Returns
     -------
@@ -168,7 +174,7 @@ def gaussian_timeseries(length: int = 10,
                                                     'its shape has to match the length of the TimeSeries.', logger)
 
     times = pd.date_range(periods=length, freq=freq, start=start_ts)
-    values = np.random.normal(mean, std, size=length)
+    values = check_random_state(random_state).normal(mean, std, size=length)
 
     return TimeSeries.from_times_and_values(times, values, freq=freq)
 